@@ -1,38 +1,35 @@
-from crewai import Agent, Crew, Process, Task, LLM
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task, before_kickoff, after_kickoff
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai_tools import FileReadTool, FileWriterTool, DirectoryReadTool, SerperDevTool, ScrapeWebsiteTool
 from job_search_agent.schemas import Resume, JobPostings, TailoredCVs, TailoredCoverLetters
+from job_search_agent.llm_router import build_llm, LatencyTracker
+from job_search_agent.tools.resume_parser import parse_resume, extract_resume_content, DEFAULT_CONFIDENCE_THRESHOLD
 
-from typing import List
+from typing import List, Optional
+from functools import cached_property
 from dotenv import load_dotenv
-import docx, pdfplumber
+import docx
 import os, json, re
 
 # -- Load environment variables --
 load_dotenv()
-GEMINI_MODEL = os.environ.get("MODEL")
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 SERPER_API_KEY = os.environ.get("SERPER_API_KEY")
 MAX_RPM = 20
 
-# -- Create LLM client --
-gemini_llm = LLM(
-    model=GEMINI_MODEL,
-    api_key=GEMINI_API_KEY,
-    temperature=0.5
-)
+# -- Default job search settings, each key can be overridden in the inputs passed to JobSearchAgent.from_inputs --
+SEARCH_CONFIG_DEFAULTS = {
+    "country": "vn",
+    "locale": "vn",
+    "location": "Hanoi, Hanoi, Vietnam",
+    "n_results": 20,
+}
 
 # -- Initialize tools --
 file_read_tool = FileReadTool()
 file_write_tool = FileWriterTool()
 directory_read_tool = DirectoryReadTool()
-search_tool = SerperDevTool(
-    country="vn",
-    locale="vn",
-    location="Hanoi, Hanoi, Vietnam",
-    n_results=20
-)
 scrape_tool = ScrapeWebsiteTool()
 
 # -- Define a utility function to sanitize text --
@@ -49,6 +46,35 @@ class JobSearchAgent():
     agents: List[BaseAgent]
     tasks: List[Task]
 
+    def __init__(self, parsed_resume: Optional[Resume] = None, search_config: Optional[dict] = None):
+        """
+        `parsed_resume` is a resume already parsed by the fast path, the CV parser agent is then left out of the crew.
+        `search_config` overrides SEARCH_CONFIG_DEFAULTS for the job scout's search tool.
+        """
+        self.parsed_resume = parsed_resume
+        self.search_config = {**SEARCH_CONFIG_DEFAULTS, **(search_config or {})}
+
+    @classmethod
+    def from_inputs(cls, inputs: dict) -> "JobSearchAgent":
+        """
+        Build the crew for the given kickoff inputs.
+        The search config is taken from the inputs, and the resume is parsed locally first unless
+        `fast_path_parsing` is False, so the CV parser agent only runs for resumes the local parser is unsure about.
+        """
+        search_config = {key: inputs[key] for key in SEARCH_CONFIG_DEFAULTS if key in inputs}
+        parsed_resume = None
+
+        if inputs.get("fast_path_parsing", True):
+            resume_content = extract_resume_content(inputs.get("input_folder", "input"))
+            threshold = inputs.get("fast_path_threshold", DEFAULT_CONFIDENCE_THRESHOLD)
+            parsed_resume, confidence, missing = parse_resume(resume_content, threshold=threshold)
+            if parsed_resume is None:
+                print(f"Fast-path parser confidence {confidence:.2f} (missing: {', '.join(missing)}), using the CV parser agent.")
+            else:
+                print(f"Fast-path parser confidence {confidence:.2f}, skipping the CV parser agent.")
+
+        return cls(parsed_resume=parsed_resume, search_config=search_config)
+
     # -- Before kickoff function --
     @before_kickoff
     def prepare_input(self, inputs):
@@ -57,43 +83,29 @@ class JobSearchAgent():
         If valid, extract the content and return it in plain text format.
         If invalid, raise an error.
         """
-        input_folder = inputs.get("input_folder", "input")
-        print(f"Checking input from folder: {input_folder}")
-        allowed_ext = [".pdf", ".docx", ".txt", ".md"]
-        resume_content = ""
-        resume_found = False
-
-        for filename in os.listdir(input_folder):
-            ext = os.path.splitext(filename)[1].lower()
-            file_path = os.path.join(input_folder, filename)
-            if os.path.isfile(file_path) and ext in allowed_ext:
-                resume_found = True
-                print(f"\n📃 Parsing file: {file_path}")
-
-                try:
-                    if ext == ".pdf":
-                        with pdfplumber.open(file_path) as pdf:
-                            for page in pdf.pages:
-                                resume_content += page.extract_text() + "\n"
-                    elif ext == ".docx":
-                        doc = docx.Document(file_path)
-                        for para in doc.paragraphs:
-                            resume_content += para.text + "\n"
-                    elif ext in [".txt", ".md"]:
-                        with open(file_path, "r", encoding="utf-8") as file:
-                            resume_content += file.read() + "\n"
-                    break # Stop after the first valid file
-                except Exception as e:
-                    raise RuntimeError(f"Error parsing file {file_path}: {str(e)}")
-        if not resume_found:
-            raise FileNotFoundError(f"No valid resume files found in {input_folder}. Supported formats: {', '.join(allowed_ext)}")
-        if not resume_content.strip():
-            raise ValueError("The resume content is empty. Please provide a valid resume file with content.")
-        
-        print("Resume content extracted successfully.")
+        # Latency stats cover a single kickoff
+        self.latency_tracker.reset()
 
         # Add resume content to the input
-        inputs["resume_content"] = resume_content.strip()
+        inputs["resume_content"] = extract_resume_content(inputs.get("input_folder", "input"))
+
+        # The search tool is configured when the crew is built, tasks.yaml can reference it as {location} etc.
+        for key, value in self.search_config.items():
+            if inputs.get(key, value) != value:
+                raise ValueError(
+                    f"The search config is set when the crew is built, pass '{key}' to JobSearchAgent.from_inputs() "
+                    "or JobSearchAgent(search_config=...) instead of kickoff()."
+                )
+        inputs.update(self.search_config)
+
+        # Without the CV parser agent, downstream tasks read the fast-path resume from their description
+        if self.parsed_resume is not None:
+            inputs["structured_resume"] = self.parsed_resume.model_dump_json(indent=2)
+            output_file = self.parse_cv_task().output_file
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            with open(output_file, "w", encoding="utf-8") as file:
+                json.dump(self.parsed_resume.model_dump(), file, indent=2, ensure_ascii=False)
+
         return inputs
 
     # -- After kickoff function --
@@ -132,6 +144,12 @@ class JobSearchAgent():
             except Exception as e:
                 print(f"Error organizing CVs: {str(e)}")
 
+        # Record per-model latency so agent routing in agents.yaml can be tuned
+        try:
+            self.latency_tracker.save(os.path.join(output_folder, "model_latency.json"))
+        except Exception as e:
+            print(f"Error saving model latency stats: {str(e)}")
+
         return output # Always return the original output
     
     def _process_cover_letters(self, file_path, output_folder):
@@ -250,6 +268,37 @@ class JobSearchAgent():
 
                 doc.save(cv_path)
 
+    @cached_property
+    def latency_tracker(self):
+        """
+        Per-crew latency stats, so each run's model_latency.json only covers its own LLM calls.
+        """
+        return LatencyTracker()
+
+    def _cv_task_config(self, task_name):
+        """
+        Config for a task that reads the parsed CV. When the fast path replaced the CV parser agent,
+        the resume is added to the task description since there is no parse_cv_task output to use as context.
+        """
+        config = self.tasks_config[task_name]
+        if self.parsed_resume is None:
+            return config
+        description = config["description"] + "\n\nParsed CV from the cv_parser agent:\n{structured_resume}\n"
+        return {**config, "description": description}
+
+    def _cv_context(self):
+        return [] if self.parsed_resume is not None else [self.parse_cv_task()]
+
+    def _llm(self, agent_name):
+        """
+        Build the LLM for an agent from its `model_routing` block in agents.yaml.
+        """
+        return build_llm(
+            self.agents_config[agent_name].get("model_routing"),
+            api_key=GEMINI_API_KEY,
+            tracker=self.latency_tracker,
+        )
+
     # -- Define agents --
     @agent
     def cv_parser(self) -> Agent:
@@ -257,7 +306,7 @@ class JobSearchAgent():
             config=self.agents_config['cv_parser'],
             verbose=True,
             max_rpm=MAX_RPM,
-            llm=gemini_llm,
+            llm=self._llm('cv_parser'),
             embedder={
                 "provider": "google",
                 "config": {
@@ -272,9 +321,9 @@ class JobSearchAgent():
         return Agent(
             config=self.agents_config['job_scout'],
             verbose=True,
-            llm=gemini_llm,
+            llm=self._llm('job_scout'),
             max_rpm=MAX_RPM,
-            tools=[search_tool, scrape_tool]
+            tools=[SerperDevTool(**self.search_config), scrape_tool]
         )
     
     @agent
@@ -282,7 +331,7 @@ class JobSearchAgent():
         return Agent(
             config=self.agents_config['cv_tailor'],
             verbose=True,
-            llm=gemini_llm,
+            llm=self._llm('cv_tailor'),
             max_rpm=MAX_RPM,
         )
 
@@ -291,7 +340,7 @@ class JobSearchAgent():
         return Agent(
             config=self.agents_config['cover_letter_writer'],
             verbose=True,
-            llm=gemini_llm,
+            llm=self._llm('cover_letter_writer'),
             max_rpm=MAX_RPM,
         )
 
@@ -307,7 +356,8 @@ class JobSearchAgent():
     @task
     def search_jobs_task(self) -> Task:
         return Task(
-            config=self.tasks_config['search_jobs_task'],
+            config=self._cv_task_config('search_jobs_task'),
+            context=self._cv_context(),
             output_json=JobPostings,
             output_file="output/job_postings.json"
         )
@@ -315,8 +365,8 @@ class JobSearchAgent():
     @task
     def tailor_cv_task(self) -> Task:
         return Task(
-            config=self.tasks_config['tailor_cv_task'],
-            context=[self.parse_cv_task(), self.search_jobs_task()],
+            config=self._cv_task_config('tailor_cv_task'),
+            context=self._cv_context() + [self.search_jobs_task()],
             output_json=TailoredCVs,
             output_file="output/tailored_cv.json",
         )
@@ -324,8 +374,8 @@ class JobSearchAgent():
     @task
     def write_cover_letter_task(self) -> Task:
         return Task(
-            config=self.tasks_config['write_cover_letter_task'],
-            context=[self.parse_cv_task(), self.search_jobs_task()],
+            config=self._cv_task_config('write_cover_letter_task'),
+            context=self._cv_context() + [self.search_jobs_task()],
             async_execution=True,
             output_json=TailoredCoverLetters,
             output_file="output/tailored_cover_letter.json",
@@ -335,9 +385,15 @@ class JobSearchAgent():
     def crew(self) -> Crew:
         """Creates the JobSearchAgent crew"""
 
+        agents, tasks = self.agents, self.tasks
+        if self.parsed_resume is not None:
+            # The resume was parsed by the fast path, see from_inputs
+            agents = [agent for agent in agents if agent is not self.cv_parser()]
+            tasks = [task for task in tasks if task is not self.parse_cv_task()]
+
         return Crew(
-            agents=self.agents, # Automatically created by the @agent decorator
-            tasks=self.tasks, # Automatically created by the @task decorator
+            agents=agents, # Automatically created by the @agent decorator
+            tasks=tasks, # Automatically created by the @task decorator
             process=Process.sequential,
             verbose=True,
         )
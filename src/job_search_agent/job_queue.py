@@ -0,0 +1,409 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import os, json, time, uuid, shutil, sqlite3
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+
+# -- Create Pydantic model for a claimed queue job --
+class QueuedJob(BaseModel):
+    """
+    Represents a candidate job claimed from the queue by a worker.
+    """
+    id: str = Field(..., description="Unique identifier of the job.")
+    payload: dict = Field(..., description="Resume and search configuration submitted for the candidate.")
+    attempts: int = Field(..., description="Number of times the job has been claimed, including the current claim.")
+    max_attempts: int = Field(..., description="Maximum number of claims before the job is marked as failed.")
+
+# -- Define the queue interface shared by all backends --
+class JobQueue(ABC):
+    """
+    Interface for a job queue with leases, heartbeats and retries.
+
+    A worker claims a job for `lease_seconds` and must keep calling `heartbeat`
+    while it works. If the lease expires (e.g. the worker crashed), the job is
+    handed to another worker until `max_attempts` claims have been made.
+    """
+
+    @abstractmethod
+    def enqueue(self, payload: dict, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> str:
+        """Add a job to the queue and return its id."""
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> Optional[QueuedJob]:
+        """Claim the next available job, or return None if the queue is empty."""
+
+    @abstractmethod
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> bool:
+        """Extend the lease on a job. Return False if the worker no longer holds the lease."""
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str, result: dict, artifacts: Dict[str, bytes]) -> bool:
+        """Publish the result and artifacts of a job. Return False if the worker no longer holds the lease."""
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Release a job after an error so it can be retried. Return False if the worker no longer holds the lease."""
+
+    @abstractmethod
+    def status(self, job_id: str) -> Optional[dict]:
+        """
+        Return the current state of a job, or None if it does not exist.
+        All backends return the keys: id, status, attempts, max_attempts, worker_id, result, error
+        and artifacts (sorted list of published artifact names).
+        """
+
+# -- SQLite/filesystem backend, intended for local runs and testing --
+class SQLiteJobQueue(JobQueue):
+    """
+    Job queue stored in a SQLite database, with artifacts written to the filesystem.
+    Safe to share between processes on the same host.
+    """
+
+    def __init__(self, db_path: str = "queue/jobs.db", artifacts_dir: Optional[str] = None):
+        self.db_path = db_path
+        self.artifacts_dir = artifacts_dir or os.path.join(os.path.dirname(db_path) or ".", "artifacts")
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    worker_id TEXT,
+                    lease_expires_at REAL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self):
+        # Autocommit mode so that transactions are controlled explicitly with BEGIN IMMEDIATE
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, payload, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, payload, status, max_attempts, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, json.dumps(payload), max_attempts, now, now),
+            )
+        return job_id
+
+    def claim(self, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._claim_next(conn, worker_id, lease_seconds, now)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+        job_id, payload, attempts, max_attempts = row
+        return QueuedJob(id=job_id, payload=json.loads(payload), attempts=attempts, max_attempts=max_attempts)
+
+    def _claim_next(self, conn, worker_id, lease_seconds, now):
+        """
+        Lease the oldest available job to `worker_id` inside an open transaction.
+        """
+        # Jobs whose lease expired and have no attempts left are given up on
+        conn.execute(
+            "UPDATE jobs SET status = 'failed', error = 'Lease expired too many times.', worker_id = NULL, updated_at = ? "
+            "WHERE status = 'running' AND lease_expires_at < ? AND attempts >= max_attempts",
+            (now, now),
+        )
+        row = conn.execute(
+            "SELECT id, payload, attempts, max_attempts FROM jobs "
+            "WHERE status = 'queued' OR (status = 'running' AND lease_expires_at < ?) "
+            "ORDER BY created_at LIMIT 1",
+            (now,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        job_id, payload, attempts, max_attempts = row
+        conn.execute(
+            "UPDATE jobs SET status = 'running', attempts = ?, worker_id = ?, lease_expires_at = ?, updated_at = ? WHERE id = ?",
+            (attempts + 1, worker_id, now + lease_seconds, now, job_id),
+        )
+        return job_id, payload, attempts + 1, max_attempts
+
+    def _update_owned(self, job_id, worker_id, assignments, params) -> bool:
+        """
+        Update a running job only if it is still leased by `worker_id`.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (*params, time.time(), job_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def heartbeat(self, job_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        return self._update_owned(job_id, worker_id, "lease_expires_at = ?", (time.time() + lease_seconds,))
+
+    def _job_dir(self, job_id: str) -> str:
+        return os.path.join(self.artifacts_dir, job_id)
+
+    def complete(self, job_id, worker_id, result, artifacts):
+        # Stage artifacts next to the job directory, they are only moved into place once the lease check passes
+        staging_dir = f"{self._job_dir(job_id)}.{uuid.uuid4().hex}.tmp"
+        for name, data in artifacts.items():
+            path = os.path.join(staging_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(data)
+
+        owned = self._update_owned(
+            job_id, worker_id,
+            "status = 'done', result = ?, error = NULL, lease_expires_at = NULL",
+            (json.dumps(result),),
+        )
+        if not owned:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return False
+
+        # The job is now done, so no other worker can publish to its directory
+        shutil.rmtree(self._job_dir(job_id), ignore_errors=True)
+        if os.path.isdir(staging_dir):
+            os.replace(staging_dir, self._job_dir(job_id))
+        return True
+
+    def fail(self, job_id, worker_id, error):
+        return self._update_owned(
+            job_id, worker_id,
+            "status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+            "error = ?, worker_id = NULL, lease_expires_at = NULL",
+            (error,),
+        )
+
+    def status(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT status, attempts, max_attempts, worker_id, result, error FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        status, attempts, max_attempts, worker_id, result, error = row
+        return {
+            "id": job_id,
+            "status": status,
+            "attempts": attempts,
+            "max_attempts": max_attempts,
+            "worker_id": worker_id,
+            "result": json.loads(result) if result else None,
+            "error": error,
+            "artifacts": self._list_artifacts(job_id),
+        }
+
+    def _list_artifacts(self, job_id: str) -> List[str]:
+        job_dir = self._job_dir(job_id)
+        return sorted(
+            os.path.relpath(os.path.join(root, filename), job_dir)
+            for root, _, filenames in os.walk(job_dir)
+            for filename in filenames
+        )
+
+# -- Redis-compatible backend, intended for production --
+# Claiming and lease checks run as Lua scripts so they stay atomic across workers
+_CLAIM_SCRIPT = """
+local id = redis.call('RPOP', KEYS[1])
+if not id then return false end
+local key = ARGV[1] .. id
+redis.call('HSET', key, 'status', 'running', 'worker_id', ARGV[2], 'lease_expires_at', ARGV[3])
+redis.call('HINCRBY', key, 'attempts', 1)
+redis.call('ZADD', KEYS[2], ARGV[3], id)
+return id
+"""
+
+_RELEASE_SCRIPT = """
+local key = ARGV[1] .. ARGV[2]
+if redis.call('HGET', key, 'worker_id') ~= ARGV[3] or redis.call('HGET', key, 'status') ~= 'running' then
+    return 0
+end
+if ARGV[4] == 'heartbeat' then
+    redis.call('HSET', key, 'lease_expires_at', ARGV[5])
+    redis.call('ZADD', KEYS[1], ARGV[5], ARGV[2])
+    return 1
+end
+redis.call('ZREM', KEYS[1], ARGV[2])
+redis.call('HDEL', key, 'worker_id', 'lease_expires_at')
+if ARGV[4] == 'complete' then
+    redis.call('HSET', key, 'status', 'done', 'result', ARGV[5])
+    redis.call('HDEL', key, 'error')
+    redis.call('DEL', KEYS[4])
+    if redis.call('EXISTS', KEYS[3]) == 1 then
+        redis.call('RENAME', KEYS[3], KEYS[4])
+    end
+elseif tonumber(redis.call('HGET', key, 'attempts')) < tonumber(redis.call('HGET', key, 'max_attempts')) then
+    redis.call('HSET', key, 'status', 'queued', 'error', ARGV[5])
+    redis.call('LPUSH', KEYS[2], ARGV[2])
+else
+    redis.call('HSET', key, 'status', 'failed', 'error', ARGV[5])
+end
+return 1
+"""
+
+_EXPIRE_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[2])
+if not score or tonumber(score) >= tonumber(ARGV[3]) then return 0 end
+redis.call('ZREM', KEYS[1], ARGV[2])
+local key = ARGV[1] .. ARGV[2]
+redis.call('HDEL', key, 'worker_id', 'lease_expires_at')
+if tonumber(redis.call('HGET', key, 'attempts')) < tonumber(redis.call('HGET', key, 'max_attempts')) then
+    redis.call('HSET', key, 'status', 'queued')
+    redis.call('LPUSH', KEYS[2], ARGV[2])
+else
+    redis.call('HSET', key, 'status', 'failed', 'error', 'Lease expired too many times.')
+end
+return 1
+"""
+
+class RedisJobQueue(JobQueue):
+    """
+    Job queue stored in Redis (or any server speaking the Redis protocol with Lua support).
+    Artifacts are stored alongside the job in a Redis hash.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", namespace: str = "job_search_agent"):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("The Redis job queue requires the 'redis' package. Install it with `pip install redis`.")
+
+        self.client = redis.Redis.from_url(url)
+        self.namespace = namespace
+        self.pending_key = f"{namespace}:pending"
+        self.leases_key = f"{namespace}:leases"
+        self.job_prefix = f"{namespace}:job:"
+        self._claim = self.client.register_script(_CLAIM_SCRIPT)
+        self._release = self.client.register_script(_RELEASE_SCRIPT)
+        self._expire = self.client.register_script(_EXPIRE_SCRIPT)
+
+    def _artifacts_key(self, job_id: str) -> str:
+        return f"{self.namespace}:artifacts:{job_id}"
+
+    def _requeue_expired(self):
+        """
+        Hand jobs with an expired lease back to the queue, or fail them if they have no attempts left.
+        """
+        now = time.time()
+        for raw_id in self.client.zrangebyscore(self.leases_key, 0, now):
+            self._expire(
+                keys=[self.leases_key, self.pending_key],
+                args=[self.job_prefix, raw_id.decode(), now],
+            )
+
+    def enqueue(self, payload, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        job_id = uuid.uuid4().hex
+        pipe = self.client.pipeline()
+        pipe.hset(self.job_prefix + job_id, mapping={
+            "payload": json.dumps(payload),
+            "status": "queued",
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "created_at": time.time(),
+        })
+        pipe.lpush(self.pending_key, job_id)
+        pipe.execute()
+        return job_id
+
+    def claim(self, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self._requeue_expired()
+        raw_id = self._claim(
+            keys=[self.pending_key, self.leases_key],
+            args=[self.job_prefix, worker_id, time.time() + lease_seconds],
+        )
+        if not raw_id:
+            return None
+
+        job_id = raw_id.decode()
+        payload, attempts, max_attempts = self.client.hmget(self.job_prefix + job_id, "payload", "attempts", "max_attempts")
+        return QueuedJob(id=job_id, payload=json.loads(payload), attempts=int(attempts), max_attempts=int(max_attempts))
+
+    def _staged_artifacts_key(self, job_id: str, worker_id: str) -> str:
+        return f"{self._artifacts_key(job_id)}:staged:{worker_id}"
+
+    def _release_owned(self, job_id, worker_id, action, value) -> bool:
+        return bool(self._release(
+            keys=[
+                self.leases_key,
+                self.pending_key,
+                self._staged_artifacts_key(job_id, worker_id),
+                self._artifacts_key(job_id),
+            ],
+            args=[self.job_prefix, job_id, worker_id, action, value],
+        ))
+
+    def heartbeat(self, job_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        return self._release_owned(job_id, worker_id, "heartbeat", time.time() + lease_seconds)
+
+    def complete(self, job_id, worker_id, result, artifacts):
+        # Stage artifacts under a worker-specific key, the release script moves them into place only if the lease is still held
+        staged_key = self._staged_artifacts_key(job_id, worker_id)
+        self.client.delete(staged_key)
+        if artifacts:
+            self.client.hset(staged_key, mapping=artifacts)
+        owned = self._release_owned(job_id, worker_id, "complete", json.dumps(result))
+        if not owned:
+            self.client.delete(staged_key)
+        return owned
+
+    def fail(self, job_id, worker_id, error):
+        return self._release_owned(job_id, worker_id, "fail", error)
+
+    def status(self, job_id):
+        data = self.client.hgetall(self.job_prefix + job_id)
+        if not data:
+            return None
+
+        data = {key.decode(): value.decode() for key, value in data.items()}
+        return {
+            "id": job_id,
+            "status": data.get("status"),
+            "attempts": int(data.get("attempts", 0)),
+            "max_attempts": int(data.get("max_attempts", DEFAULT_MAX_ATTEMPTS)),
+            "worker_id": data.get("worker_id") or None,
+            "result": json.loads(data["result"]) if data.get("result") else None,
+            "error": data.get("error"),
+            "artifacts": sorted(name.decode() for name in self.client.hkeys(self._artifacts_key(job_id))),
+        }
+
+# -- Define a utility function to pick a backend from a URL --
+def get_job_queue(url: Optional[str] = None) -> JobQueue:
+    """
+    Create a job queue from a URL such as 'sqlite:///queue/jobs.db' or 'redis://host:6379/0'.
+    Defaults to the JOB_QUEUE_URL environment variable, then to a local SQLite queue.
+    """
+    url = url or os.environ.get("JOB_QUEUE_URL", "sqlite:///queue/jobs.db")
+    scheme = urlparse(url).scheme
+
+    if scheme == "sqlite":
+        return SQLiteJobQueue(db_path=url[len("sqlite:///"):])
+    elif scheme in ["redis", "rediss", "unix"]:
+        return RedisJobQueue(url=url, namespace=os.environ.get("JOB_QUEUE_NAMESPACE", "job_search_agent"))
+    else:
+        raise ValueError(f"Unsupported job queue URL: {url}. Use a 'sqlite:///' or 'redis://' URL.")
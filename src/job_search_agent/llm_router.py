@@ -0,0 +1,181 @@
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.exceptions.context_window_exceeding_exception import LLMContextLengthExceededException
+
+from typing import Any, Dict, List, Optional, Union
+import os, json, time, threading
+import litellm
+
+# Model used by `tier: fast` agents when FAST_MODEL is not set
+DEFAULT_FAST_MODEL = "gemini/gemini-2.0-flash-lite"
+
+# -- Record per-model latency so routing can be tuned --
+class LatencyTracker:
+    """
+    Thread-safe record of call count, failures and latency for each model.
+    """
+
+    def __init__(self, smoothing: float = 0.3):
+        self.smoothing = smoothing
+        self._stats: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float, ok: bool = True):
+        with self._lock:
+            stats = self._stats.setdefault(model, {
+                "calls": 0,
+                "failures": 0,
+                "avg_latency": None,
+                "max_latency": 0.0,
+            })
+            stats["calls"] += 1
+            if not ok:
+                stats["failures"] += 1
+                return
+
+            # Exponentially weighted moving average favours recent calls
+            if stats["avg_latency"] is None:
+                stats["avg_latency"] = seconds
+            else:
+                stats["avg_latency"] = self.smoothing * seconds + (1 - self.smoothing) * stats["avg_latency"]
+            stats["max_latency"] = max(stats["max_latency"], seconds)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {model: dict(stats) for model, stats in self._stats.items()}
+
+    def save(self, file_path: str):
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, indent=2)
+
+# -- Route calls to a primary model with a latency-aware fallback --
+class RoutedLLM(BaseLLM):
+    """
+    LLM that calls a primary model and falls back to a secondary model
+    when the primary errors, is throttled, or has been responding slowly.
+
+    After a throttle, timeout or slow response the primary is skipped for
+    `cooldown` seconds, then tried again. Calls are recorded in `tracker` if one is given.
+    """
+
+    def __init__(
+        self,
+        primary: LLM,
+        fallback: Optional[LLM] = None,
+        slow_threshold: Optional[float] = None,
+        cooldown: float = 60.0,
+        tracker: Optional[LatencyTracker] = None,
+    ):
+        super().__init__(model=primary.model, temperature=primary.temperature)
+        self.primary = primary
+        self.fallback = fallback
+        self.slow_threshold = slow_threshold
+        self.cooldown = cooldown
+        self.tracker = tracker
+        self._primary_resumes_at = 0.0
+
+    def _record(self, model: str, seconds: float, ok: bool = True):
+        if self.tracker is not None:
+            self.tracker.record(model, seconds, ok=ok)
+
+    def _candidates(self) -> List[LLM]:
+        if self.fallback is None:
+            return [self.primary]
+        if time.monotonic() < self._primary_resumes_at:
+            return [self.fallback, self.primary]
+        return [self.primary, self.fallback]
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Union[str, Any]:
+        candidates = self._candidates()
+        for index, llm in enumerate(candidates):
+            # Stop words are set on the router by the agent executor
+            llm.stop = self.stop
+            started = time.monotonic()
+            try:
+                result = llm.call(messages, tools=tools, callbacks=callbacks, available_functions=available_functions, **kwargs)
+            except LLMContextLengthExceededException:
+                # Handled by the agent executor, which may summarize and retry
+                raise
+            except Exception as e:
+                self._record(llm.model, time.monotonic() - started, ok=False)
+                if llm is self.primary and isinstance(e, (litellm.RateLimitError, litellm.Timeout)):
+                    self._primary_resumes_at = time.monotonic() + self.cooldown
+                if index == len(candidates) - 1:
+                    raise
+                print(f"⚠️ Model {llm.model} failed ({type(e).__name__}), falling back to {candidates[index + 1].model}")
+                continue
+
+            elapsed = time.monotonic() - started
+            self._record(llm.model, elapsed)
+            if llm is self.primary and self.slow_threshold and elapsed > self.slow_threshold:
+                self._primary_resumes_at = time.monotonic() + self.cooldown
+            return result
+
+    def supports_function_calling(self) -> bool:
+        return self.primary.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.primary.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        sizes = [self.primary.get_context_window_size()]
+        if self.fallback is not None:
+            sizes.append(self.fallback.get_context_window_size())
+        # Prompts must fit whichever model ends up serving the call
+        return min(sizes)
+
+# -- Define a utility function to build an agent's LLM from its config --
+def build_llm(
+    model_config: Optional[dict] = None,
+    api_key: Optional[str] = None,
+    tracker: Optional[LatencyTracker] = None,
+) -> BaseLLM:
+    """
+    Create the LLM for an agent from the `model_routing` block of agents.yaml.
+    The primary model is `primary` if set, FAST_MODEL for `tier: fast` agents, and MODEL otherwise.
+    The fallback defaults to FALLBACK_MODEL and then MODEL, so an agent routed to a cheaper model
+    still falls back to the main one. Pass a `tracker` to record per-model latency.
+    """
+    model_config = model_config or {}
+    if model_config.get("primary"):
+        primary_model = model_config["primary"]
+    elif model_config.get("tier") == "fast":
+        primary_model = os.environ.get("FAST_MODEL", DEFAULT_FAST_MODEL)
+    else:
+        primary_model = os.environ.get("MODEL")
+    fallback_model = model_config.get("fallback") or os.environ.get("FALLBACK_MODEL") or os.environ.get("MODEL")
+    temperature = model_config.get("temperature", 0.5)
+
+    primary = LLM(
+        model=primary_model,
+        api_key=api_key,
+        temperature=temperature,
+        timeout=model_config.get("timeout"),
+    )
+    if not fallback_model or fallback_model == primary_model:
+        return RoutedLLM(primary, tracker=tracker)
+
+    fallback = LLM(
+        model=fallback_model,
+        api_key=api_key,
+        temperature=temperature,
+    )
+    return RoutedLLM(
+        primary,
+        fallback=fallback,
+        slow_threshold=model_config.get("slow_threshold"),
+        cooldown=model_config.get("cooldown", 60.0),
+        tracker=tracker,
+    )
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
+import os
 import sys
+import json
 import warnings
 
 from datetime import datetime
@@ -21,7 +23,7 @@ def run():
     }
     
     try:
-        JobSearchAgent().crew().kickoff()
+        JobSearchAgent.from_inputs(inputs).crew().kickoff(inputs=inputs)
     except Exception as e:
         raise Exception(f"An error occurred while running the crew: {e}")
 
@@ -33,7 +35,7 @@ def train():
     inputs = {
     }
     try:
-        JobSearchAgent().crew().train(n_iterations=int(sys.argv[1]), filename=sys.argv[2])
+        JobSearchAgent.from_inputs(inputs).crew().train(n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=inputs)
 
     except Exception as e:
         raise Exception(f"An error occurred while training the crew: {e}")
@@ -56,7 +58,41 @@ def test():
     }
     
     try:
-        JobSearchAgent().crew().test(n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2])
+        JobSearchAgent.from_inputs(inputs).crew().test(n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2], inputs=inputs)
 
     except Exception as e:
         raise Exception(f"An error occurred while testing the crew: {e}")
+
+def worker():
+    """
+    Run a queue worker that processes candidate jobs until stopped.
+    The queue is chosen with JOB_QUEUE_URL (e.g. sqlite:///queue/jobs.db or redis://host:6379/0).
+    """
+    from job_search_agent.job_queue import get_job_queue, DEFAULT_LEASE_SECONDS
+    from job_search_agent.worker import run_worker
+
+    try:
+        run_worker(
+            get_job_queue(),
+            worker_id=os.environ.get("WORKER_ID"),
+            lease_seconds=int(os.environ.get("JOB_LEASE_SECONDS", DEFAULT_LEASE_SECONDS)),
+        )
+    except KeyboardInterrupt:
+        print("Worker stopped.")
+    except Exception as e:
+        raise Exception(f"An error occurred while running the worker: {e}")
+
+def submit():
+    """
+    Submit a resume to the job queue for a worker to process.
+    Usage: submit <resume_path> [search_config_json]
+    """
+    from job_search_agent.job_queue import get_job_queue
+    from job_search_agent.worker import build_job_payload
+
+    try:
+        search_config = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {}
+        job_id = get_job_queue().enqueue(build_job_payload(sys.argv[1], search_config))
+        print(f"Submitted job {job_id}")
+    except Exception as e:
+        raise Exception(f"An error occurred while submitting the job: {e}")
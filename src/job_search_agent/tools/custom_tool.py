@@ -1,7 +1,8 @@
 from crewai.tools import BaseTool
+from job_search_agent.tools.resume_parser import docx_to_markdown, extract_resume_content
 from typing import Type
 from pydantic import BaseModel, Field
-import os, json, re
+import os, json, re, asyncio
 import docx, pdfplumber
 
 
@@ -43,11 +44,8 @@ class cvParserTool(BaseTool):
         return text.strip()
     
     def _parse_docx(self, file_path: str) -> str:
-        text = ""
         doc = docx.Document(file_path)
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-        return text.strip()
+        return docx_to_markdown(doc).strip()
 
     def _parse_text(self, file_path: str) -> str:
         with open(file_path, 'r', encoding='utf-8') as file:
@@ -58,43 +56,19 @@ def check_resume_and_extract_content(input_folder: str = "input") -> str:
     Verify the input file path exists and is accessible.
     If valid, extract the content and return it in plain text format.
     If invalid, raise an error.
+    Uses the same extraction as the crew, so DOCX headings and lists are kept as Markdown.
     """
-    print(f"Checking resume in folder: {input_folder}")
-    allowed_ext = ['.pdf', '.docx', '.txt', '.md']
-    resume_content = ""
-    resume_found = False
-
-    for filename in os.listdir(input_folder):
-        ext = os.path.splitext(filename)[1].lower()
-        file_path = os.path.join(input_folder, filename)
-        if os.path.isfile(file_path) and ext in allowed_ext:
-            resume_found = True
-            print(f"\n📃 Parsing file: {file_path}")
-
-            try:
-                if ext == ".pdf":
-                    with pdfplumber.open(file_path) as pdf:
-                        for page in pdf.pages:
-                            resume_content += page.extract_text() + "\n"
-                elif ext == ".docx":
-                    doc = docx.Document(file_path)
-                    for para in doc.paragraphs:
-                        resume_content += para.text + "\n"
-                elif ext in [".txt", ".md"]:
-                    with open(file_path, 'r', encoding='utf-8') as file:
-                        resume_content += file.read() + "\n"
-                else:
-                    raise ValueError(f"Unsupported file format: {ext}")
-                break  # Exit loop after first valid file
-            except Exception as e:
-                raise RuntimeError(f"Error parsing file {file_path}: {str(e)}")
-    
-    if not resume_found:
-        raise SystemExit("No valid resume file found in the input folder.")
-    if not resume_content.strip():
-        raise SystemExit("The resume file is empty or could not be read.")
-    print(f"Successfully parsed file: {file_path}")
-    return resume_content.strip()
+    try:
+        return extract_resume_content(input_folder)
+    except (FileNotFoundError, ValueError) as e:
+        raise SystemExit(str(e))
+
+async def async_check_resume_and_extract_content(input_folder: str = "input") -> str:
+    """
+    Async variant of check_resume_and_extract_content for asyncio callers.
+    File reading and PDF/DOCX parsing run on a worker thread.
+    """
+    return await asyncio.to_thread(check_resume_and_extract_content, input_folder)
 
 def sanitize(text):
     text = re.sub(r'[\\/*?:"<>|]', "", text)  # remove invalid chars
@@ -217,4 +191,11 @@ def organize_output_files(output_folder: str = "output"):
             for interest in interests:
                 doc.add_paragraph(f"{interest.strip()}", style='ListBullet')
 
-            doc.save(cv_path)
\ No newline at end of file
+            doc.save(cv_path)
+
+async def async_organize_output_files(output_folder: str = "output"):
+    """
+    Async variant of organize_output_files. Building and saving the Word documents
+    runs on a worker thread so the event loop is not blocked.
+    """
+    await asyncio.to_thread(organize_output_files, output_folder)
@@ -0,0 +1,427 @@
+from job_search_agent.schemas import Resume
+from pydantic import ValidationError
+from typing import Dict, List, Optional, Tuple
+import docx, pdfplumber
+import os, re
+
+# Resumes parsed with at least this confidence skip the LLM parsing step
+DEFAULT_CONFIDENCE_THRESHOLD = 0.8
+
+# -- Map common section titles to Resume fields --
+SECTION_ALIASES = {
+    "summary": ["summary", "professional summary", "objective", "career objective", "profile", "about me", "about"],
+    "work_experience": ["experience", "work experience", "professional experience", "employment history",
+                        "work history", "internship experience", "internships", "career history"],
+    "education": ["education", "academic background", "education and training"],
+    "certifications": ["certifications", "certificates", "licenses", "licenses & certifications",
+                       "achievements", "awards", "achievements & awards", "honors & awards"],
+    "skills": ["skills", "technical skills", "skills & tools", "core competencies", "competencies"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects"],
+    "languages": ["languages", "language skills"],
+    "interests": ["interests", "hobbies", "hobbies & interests", "extracurricular activities", "activities"],
+    "ignored": ["references", "referees"],
+}
+_SECTION_LOOKUP = {alias: field for field, aliases in SECTION_ALIASES.items() for alias in aliases}
+
+MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+# 'Mar 2021', '2021', '03/2021' or '03-2021'
+DATE = rf"(?:(?:0?[1-9]|1[0-2])[/.-]\d{{4}}|(?:{MONTH}\s+)?\d{{4}})"
+DATE_RANGE = re.compile(
+    rf"({DATE}\s*[–—-]\s*(?:{DATE}|present|now|current)|{DATE})",
+    re.IGNORECASE,
+)
+YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+URL = re.compile(r"https?://[^\s)\]]+")
+BULLET = re.compile(r"^\s*(?:[-*•▪●]|\d+[.)])\s+")
+TITLE_SEPARATOR = re.compile(r"\s+(?:[–—|-]|at|@)\s+")
+DOCUMENT_TITLE = re.compile(r"(?:my\s+)?(?:resume|résumé|cv|curriculum vitae)(?:\s*\(cv\))?", re.IGNORECASE)
+NAME = re.compile(r"[^\W\d_]+(?:[\s'.-]+[^\W\d_]+){1,5}")
+
+# -- Define utility functions to clean markdown/plain text lines --
+def clean(text: str) -> str:
+    """
+    Strip markdown emphasis, links and decorative symbols from a line.
+    """
+    text = re.sub(r"\[([^\]]*)\]\(([^)]*)\)", r"\1", text)  # [label](url) -> label
+    text = re.sub(r"[*_`]+", "", text)
+    text = re.sub(r"^[^\w(“\"]+|[^\w)”\".%+#]+$", "", text.strip())  # leading/trailing emoji and punctuation
+    return re.sub(r"\s+", " ", text).strip()
+
+def match_section(line: str) -> Optional[str]:
+    """
+    Return the Resume field for a section heading line, or None if the line is not a known heading.
+    Markdown headings ('## Skills') and standalone title lines ('SKILLS:') are both recognized.
+    """
+    stripped = line.strip()
+    title = clean(stripped.lstrip("#")).rstrip(":").strip().lower()
+    if not title or len(title) > 40:
+        return None
+    if title in _SECTION_LOOKUP:
+        return _SECTION_LOOKUP[title]
+    if re.match(r"##\s", stripped):
+        # Unknown second-level markdown headings still close the previous section
+        return "unknown"
+    return None
+
+def split_sections(text: str) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Split resume text into the header (contact block) and a list of lines per section.
+    """
+    header, sections = [], {}
+    current = None
+    for line in text.splitlines():
+        if re.fullmatch(r"\s*(?:-{3,}|\*{3,}|_{3,})\s*", line):
+            continue  # horizontal rule
+        field = match_section(line)
+        if field is not None:
+            current = field
+            sections.setdefault(current, [])
+            continue
+        if current is None:
+            header.append(line)
+        else:
+            sections[current].append(line)
+    return header, sections
+
+def is_entry_marker(line: str) -> bool:
+    stripped = line.strip()
+    return stripped.startswith("###") or bool(re.fullmatch(r"\*\*[^*]+\*\*", stripped))
+
+def is_date_line(line: str) -> bool:
+    """
+    Return True for a short non-bullet line carrying a date or date range, e.g. 'Jan 2020 – Present'.
+    """
+    cleaned = clean(line)
+    return not BULLET.match(line) and len(cleaned) < 60 and find_dates(cleaned) is not None
+
+def starts_dated_entry(lines: List[str], index: int) -> bool:
+    """
+    Return True if the line at `index` is a title followed by its dates, with at most one line
+    (e.g. the company) in between and no bullets before the dates.
+    """
+    if BULLET.match(lines[index]) or is_date_line(lines[index]):
+        return False
+    for line in lines[index + 1:index + 3]:
+        if BULLET.match(line):
+            return False
+        if is_date_line(line):
+            return True
+    return False
+
+def split_entries(lines: List[str]) -> List[List[str]]:
+    """
+    Group section lines into entries. An entry starts at a '###' heading or a line that is bold as a whole.
+    Sections without such markers start a new entry at each title-plus-date pair that follows a dated entry.
+    """
+    lines = [line for line in lines if line.strip()]
+    has_markers = any(is_entry_marker(line) for line in lines)
+    entries, current, current_dated = [], [], False
+    for index, line in enumerate(lines):
+        if has_markers:
+            starts_entry = is_entry_marker(line)
+        else:
+            starts_entry = current_dated and starts_dated_entry(lines, index)
+        if starts_entry and current:
+            entries.append(current)
+            current, current_dated = [], False
+        current.append(line)
+        current_dated = current_dated or is_date_line(line)
+    if current:
+        entries.append(current)
+    return entries
+
+def split_bullets(lines: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Return the (plain lines, bullet lines) of an entry, cleaned.
+    """
+    plain, bullets = [], []
+    for line in lines:
+        if BULLET.match(line):
+            bullets.append(clean(BULLET.sub("", line, count=1)))
+        elif clean(line):
+            plain.append(clean(line))
+    return plain, bullets
+
+def find_dates(text: str) -> Optional[str]:
+    match = DATE_RANGE.search(text)
+    return match.group(1).strip() if match else None
+
+def has_unclear_dates(text: str) -> bool:
+    """
+    Return True if a date line has several date ranges, or a year the date pattern did not capture
+    (e.g. an unsupported format), so its dates cannot be trusted.
+    """
+    return len(DATE_RANGE.findall(text)) > 1 or bool(YEAR.search(DATE_RANGE.sub(" ", text)))
+
+# -- Define section parsers --
+def parse_contact_info(header: List[str]) -> dict:
+    text = "\n".join(header)
+    contact = {"name": None, "location": None, "email": None, "linkedin": None, "github": None}
+
+    for line in header:
+        name = clean(line.lstrip("#"))
+        # Skip document titles such as 'RESUME' or 'Curriculum Vitae' above the name
+        if name and not DOCUMENT_TITLE.fullmatch(name):
+            contact["name"] = name
+            break
+
+    email = EMAIL.search(text)
+    contact["email"] = email.group(0) if email else None
+    for url in URL.findall(text):
+        if "linkedin.com" in url:
+            contact["linkedin"] = url
+        elif "github.com" in url:
+            contact["github"] = url
+
+    for line in header[1:]:
+        cleaned = clean(line)
+        if "📍" in line or re.match(r"(?i)(location|address)\s*:", cleaned):
+            contact["location"] = re.sub(r"(?i)^(location|address)\s*:\s*", "", cleaned)
+            break
+    else:
+        # Fall back to the first "City, Country" looking line without contact details
+        for line in header[1:]:
+            cleaned = clean(line)
+            if "," in cleaned and not re.search(r"[@\d]|http|linkedin|github", cleaned, re.IGNORECASE):
+                contact["location"] = cleaned
+                break
+    return contact
+
+def parse_titled_entry(entry: List[str]) -> dict:
+    """
+    Parse an entry shaped like a title line, optional subtitle/date lines and bullets.
+    The entry is flagged as ambiguous when it has several date ranges, text after its dates or dates
+    in a format that is not fully understood, which usually means the entry was not split or read correctly.
+    """
+    plain, bullets = split_bullets(entry)
+    title = clean(entry[0].lstrip("#")) if entry else ""
+    rest = plain[1:] if plain and plain[0] == title else plain
+
+    dates, subtitle, description = None, None, []
+    date_count, after_dates, unclear_dates = 0, False, False
+    for line in rest:
+        line_dates = find_dates(line) if len(line) < 60 else None
+        if line_dates:
+            date_count += 1
+            unclear_dates = unclear_dates or has_unclear_dates(line)
+        elif dates is not None:
+            after_dates = True
+
+        if line_dates and dates is None:
+            dates = line_dates
+        elif subtitle is None and not description:
+            subtitle = line
+        else:
+            description.append(line)
+    return {
+        "title": title,
+        "subtitle": subtitle,
+        "dates": dates,
+        "description": description,
+        "bullets": bullets,
+        "ambiguous": date_count > 1 or after_dates or unclear_dates,
+    }
+
+def parse_work_experience(lines: List[str]) -> Tuple[List[dict], bool]:
+    """
+    Return the work experience entries and whether any of them looked ambiguous.
+    """
+    experiences, ambiguous = [], False
+    for entry in split_entries(lines):
+        parsed = parse_titled_entry(entry)
+        ambiguous = ambiguous or parsed["ambiguous"]
+        title, company = parsed["title"], parsed["subtitle"]
+        parts = TITLE_SEPARATOR.split(title, maxsplit=1)
+        if len(parts) == 2:
+            title, company = parts[0], parts[1]
+        experiences.append({
+            "job_title": title,
+            "company_name": company,
+            "dates": parsed["dates"],
+            "responsibilities": parsed["description"] + parsed["bullets"],
+        })
+    return experiences, ambiguous
+
+def parse_education(lines: List[str]) -> Tuple[List[dict], bool]:
+    """
+    Return the education entries and whether any of them looked ambiguous.
+    """
+    education, ambiguous = [], False
+    for entry in split_entries(lines):
+        parsed = parse_titled_entry(entry)
+        ambiguous = ambiguous or parsed["ambiguous"]
+        education.append({"degree": parsed["title"], "university": parsed["subtitle"], "dates": parsed["dates"]})
+    return education, ambiguous
+
+def parse_projects(lines: List[str]) -> List[dict]:
+    projects = []
+    for entry in split_entries(lines):
+        parsed = parse_titled_entry(entry)
+        link = URL.search("\n".join(entry))
+        description = [line for line in [parsed["subtitle"]] + parsed["description"] if line]
+        projects.append({
+            "project_name": parsed["title"],
+            "description": " ".join(description + parsed["bullets"]),
+            "link": link.group(0) if link else None,
+        })
+    return projects
+
+def parse_list(lines: List[str]) -> List[str]:
+    plain, bullets = split_bullets(lines)
+    return bullets or plain
+
+def parse_certifications(lines: List[str]) -> List[dict]:
+    certifications = []
+    for item in parse_list(lines):
+        name, _, score = item.partition(":")
+        certifications.append({"name": name.strip(), "score": score.strip() or None})
+    return certifications
+
+def parse_skills(lines: List[str]) -> dict:
+    """
+    Sort 'Category: a, b, c' skill lines into the Resume skill groups by their category name.
+    """
+    skills = {"technical_tools": [], "domain_knowledge": [], "project_management": [], "languages": []}
+    for item in parse_list(lines):
+        category, separator, values = item.partition(":")
+        if not separator:
+            category, values = "", item
+        category = category.lower()
+        values = [value.strip() for value in re.split(r"[,;]", values) if value.strip()]
+
+        if re.search(r"domain|industry|knowledge|business", category):
+            skills["domain_knowledge"].extend(values)
+        elif re.search(r"management|methodolog|soft|leadership", category):
+            skills["project_management"].extend(values)
+        elif "language" in category and "programming" not in category:
+            skills["languages"].extend(values)
+        else:
+            skills["technical_tools"].extend(values)
+    return skills
+
+# -- Define the fast-path parser --
+def parse_resume(text: str, threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> Tuple[Optional[Resume], float, List[str]]:
+    """
+    Parse a well-structured resume (Markdown, or plain text with section headings) into a Resume
+    without calling an LLM.
+
+    Returns (resume, confidence, missing) where `resume` is None when required fields are missing
+    or the confidence is below `threshold`, so the caller should fall back to the LLM parser.
+    """
+    header, sections = split_sections(text)
+    contact = parse_contact_info(header)
+    summary_lines = split_bullets(sections.get("summary", []))
+    summary = " ".join(summary_lines[0] + summary_lines[1])
+
+    skills = parse_skills(sections.get("skills", []))
+    skills["languages"].extend(parse_list(sections.get("languages", [])))
+
+    work_experience, experience_ambiguous = parse_work_experience(sections.get("work_experience", []))
+    education, education_ambiguous = parse_education(sections.get("education", []))
+
+    data = {
+        "contact_info": contact,
+        "summary": summary,
+        "work_experience": work_experience,
+        "education": education,
+        "certifications": parse_certifications(sections.get("certifications", [])),
+        "skills": skills,
+        "projects": parse_projects(sections.get("projects", [])),
+        "interests": parse_list(sections.get("interests", [])),
+    }
+
+    # Each check is (weight, passed). Required fields are also checked by the Resume model.
+    checks = {
+        # A wrong name would end up on every tailored CV, so a line that does not look like a name weighs heavily
+        "contact_info.name": (4, bool(contact["name"]) and bool(NAME.fullmatch(contact["name"]))),
+        "contact_info.email": (2, bool(contact["email"])),
+        "contact_info.location": (1, bool(contact["location"])),
+        "summary": (2, bool(summary)),
+        "work_experience": (2, bool(work_experience) and not experience_ambiguous and all(
+            exp["job_title"] and exp["company_name"] and exp["dates"] for exp in work_experience)),
+        "education": (2, bool(education) and not education_ambiguous and all(
+            edu["degree"] and edu["university"] and edu["dates"] for edu in education)),
+        # Merged or oddly laid out entries are better left to the LLM parser
+        "entries_unambiguous": (2, not (experience_ambiguous or education_ambiguous)),
+        "skills": (1, any(skills.values())),
+        "projects": (1, "projects" in sections),
+    }
+    missing = [name for name, (_, passed) in checks.items() if not passed]
+    confidence = sum(weight for weight, passed in checks.values() if passed) / sum(weight for weight, _ in checks.values())
+
+    # The Resume model accepts empty strings, but these fields are required
+    if not contact["name"] or not summary:
+        return None, confidence, missing
+
+    try:
+        resume = Resume.model_validate(data)
+    except ValidationError as e:
+        missing.extend(".".join(str(loc) for loc in error["loc"]) for error in e.errors())
+        return None, confidence, sorted(set(missing))
+
+    if confidence < threshold:
+        return None, confidence, missing
+    return resume, confidence, missing
+
+def docx_to_markdown(doc) -> str:
+    """
+    Convert a python-docx Document to Markdown-like text, keeping heading levels and list items
+    so the fast-path parser can find the sections.
+    """
+    lines = []
+    for para in doc.paragraphs:
+        style = para.style.name.lower() if para.style is not None else ""
+        text = para.text.strip()
+        if not text:
+            lines.append("")
+        elif style == "title":
+            lines.append(f"# {text}")
+        elif style.startswith("heading"):
+            level = re.search(r"\d+", style)
+            lines.append(f"{'#' * (int(level.group(0)) + 1 if level else 2)} {text}")
+        elif "list" in style:
+            lines.append(f"- {text}")
+        else:
+            lines.append(text)
+    return "\n".join(lines)
+
+# -- Define the resume file reader shared by the crew and the tools --
+def extract_resume_content(input_folder: str = "input") -> str:
+    """
+    Read the first resume file (.pdf, .docx, .txt or .md) in the input folder and return its text.
+    DOCX files are converted with docx_to_markdown so the fast-path parser can find the sections.
+    """
+    print(f"Checking input from folder: {input_folder}")
+    allowed_ext = [".pdf", ".docx", ".txt", ".md"]
+    resume_content = ""
+    resume_found = False
+
+    for filename in os.listdir(input_folder):
+        ext = os.path.splitext(filename)[1].lower()
+        file_path = os.path.join(input_folder, filename)
+        if os.path.isfile(file_path) and ext in allowed_ext:
+            resume_found = True
+            print(f"\n📃 Parsing file: {file_path}")
+
+            try:
+                if ext == ".pdf":
+                    with pdfplumber.open(file_path) as pdf:
+                        for page in pdf.pages:
+                            resume_content += page.extract_text() + "\n"
+                elif ext == ".docx":
+                    doc = docx.Document(file_path)
+                    resume_content += docx_to_markdown(doc) + "\n"
+                elif ext in [".txt", ".md"]:
+                    with open(file_path, "r", encoding="utf-8") as file:
+                        resume_content += file.read() + "\n"
+                break # Stop after the first valid file
+            except Exception as e:
+                raise RuntimeError(f"Error parsing file {file_path}: {str(e)}")
+    if not resume_found:
+        raise FileNotFoundError(f"No valid resume files found in {input_folder}. Supported formats: {', '.join(allowed_ext)}")
+    if not resume_content.strip():
+        raise ValueError("The resume content is empty. Please provide a valid resume file with content.")
+
+    print("Resume content extracted successfully.")
+    return resume_content.strip()
@@ -0,0 +1,169 @@
+from job_search_agent.crew import JobSearchAgent, SEARCH_CONFIG_DEFAULTS
+from job_search_agent.job_queue import JobQueue, QueuedJob, DEFAULT_LEASE_SECONDS
+
+from typing import Dict, Optional
+import os, time, base64, socket, tempfile, threading, traceback
+
+# -- Define utility functions to pack and unpack candidate jobs --
+def validate_search_config(search_config: dict) -> dict:
+    """
+    Reject search config keys the crew does not use, so typos do not silently fall back to the defaults.
+    """
+    unknown = sorted(set(search_config) - set(SEARCH_CONFIG_DEFAULTS))
+    if unknown:
+        raise ValueError(
+            f"Unsupported search config keys: {', '.join(unknown)}. "
+            f"Supported keys: {', '.join(SEARCH_CONFIG_DEFAULTS)}"
+        )
+    return search_config
+
+def build_job_payload(resume_path: str, search_config: Optional[dict] = None) -> dict:
+    """
+    Pack a resume file and its search configuration into a queue payload.
+    The file content is base64-encoded so binary formats (.pdf, .docx) survive the trip.
+    """
+    if not os.path.isfile(resume_path):
+        raise FileNotFoundError(f"The file {resume_path} does not exist.")
+
+    with open(resume_path, "rb") as file:
+        resume_data = base64.b64encode(file.read()).decode("ascii")
+
+    return {
+        "resume_filename": os.path.basename(resume_path),
+        "resume_data": resume_data,
+        "search_config": validate_search_config(search_config or {}),
+    }
+
+def collect_artifacts(output_folder: str) -> Dict[str, bytes]:
+    """
+    Read every file under the output folder, keyed by its path relative to the folder.
+    """
+    artifacts = {}
+    for root, _, filenames in os.walk(output_folder):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            with open(path, "rb") as file:
+                artifacts[os.path.relpath(path, output_folder)] = file.read()
+    return artifacts
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+# -- Define the heartbeat thread that keeps a job's lease alive --
+class LeaseKeeper(threading.Thread):
+    """
+    Renew the lease on a job in the background while the crew is running.
+    """
+
+    def __init__(self, queue: JobQueue, job_id: str, worker_id: str, lease_seconds: int):
+        super().__init__(daemon=True)
+        self.queue = queue
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.lease_lost = False
+        self._stopped = threading.Event()
+
+    def run(self):
+        # Renew at a third of the lease so a single slow heartbeat does not lose it
+        while not self._stopped.wait(self.lease_seconds / 3):
+            try:
+                if not self.queue.heartbeat(self.job_id, self.worker_id, self.lease_seconds):
+                    print(f"⚠️ Lost lease on job {self.job_id}.")
+                    self.lease_lost = True
+                    return
+            except Exception as e:
+                print(f"⚠️ Heartbeat failed for job {self.job_id}: {str(e)}")
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+# -- Define the worker that runs candidate jobs from the queue --
+def process_job(job: QueuedJob) -> tuple:
+    """
+    Run the crew for a single candidate job in its own working directory.
+    Returns the result summary and the artifacts written to the output folder.
+    """
+    payload = job.payload
+    inputs = dict(validate_search_config(payload.get("search_config", {})))
+
+    with tempfile.TemporaryDirectory(prefix=f"job_search_agent-{job.id}-") as workdir:
+        input_folder = os.path.join(workdir, "input")
+        os.makedirs(input_folder)
+
+        resume_path = os.path.join(input_folder, os.path.basename(payload["resume_filename"]))
+        with open(resume_path, "wb") as file:
+            file.write(base64.b64decode(payload["resume_data"]))
+        inputs["input_folder"] = input_folder
+
+        # The crew writes to relative "output/" paths, so run it from the job's own directory
+        previous_cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            output = JobSearchAgent.from_inputs(inputs).crew().kickoff(inputs=inputs)
+        finally:
+            os.chdir(previous_cwd)
+
+        result = {
+            "raw": output.raw,
+            "token_usage": output.token_usage.model_dump() if output.token_usage else None,
+        }
+        return result, collect_artifacts(os.path.join(workdir, "output"))
+
+def run_worker(
+    queue: JobQueue,
+    worker_id: Optional[str] = None,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    poll_interval: float = 5.0,
+    max_jobs: Optional[int] = None,
+):
+    """
+    Claim candidate jobs from the queue, run the crew and publish results until stopped.
+    If `max_jobs` is set, exit after processing that many jobs.
+    """
+    worker_id = worker_id or default_worker_id()
+    processed = 0
+    print(f"👷 Worker {worker_id} started.")
+
+    while max_jobs is None or processed < max_jobs:
+        # Queue backends can fail temporarily (e.g. a dropped Redis connection or a busy SQLite database),
+        # which must not stop a long-running worker
+        try:
+            job = queue.claim(worker_id, lease_seconds)
+        except Exception as e:
+            print(f"⚠️ Could not claim a job: {str(e)}")
+            time.sleep(poll_interval)
+            continue
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+
+        print(f"\n📥 Claimed job {job.id} (attempt {job.attempts}/{job.max_attempts})")
+        keeper = LeaseKeeper(queue, job.id, worker_id, lease_seconds)
+        keeper.start()
+        # The crew raises SystemExit when the LLM returns no results, which must fail the job, not the worker
+        try:
+            result, artifacts = process_job(job)
+        except (Exception, SystemExit) as e:
+            keeper.stop()
+            print(f"❌ Job {job.id} failed: {str(e)}")
+            try:
+                queue.fail(job.id, worker_id, f"{str(e)}\n{traceback.format_exc()}")
+            except Exception as queue_error:
+                # The lease expires on its own and the job is retried by another claim
+                print(f"⚠️ Could not report failure of job {job.id}: {str(queue_error)}")
+                time.sleep(poll_interval)
+        else:
+            keeper.stop()
+            try:
+                published = not keeper.lease_lost and queue.complete(job.id, worker_id, result, artifacts)
+            except Exception as queue_error:
+                print(f"⚠️ Could not publish job {job.id}: {str(queue_error)}")
+                time.sleep(poll_interval)
+            else:
+                if published:
+                    print(f"✅ Job {job.id} completed with {len(artifacts)} artifacts.")
+                else:
+                    print(f"⚠️ Job {job.id} finished after its lease expired, result discarded.")
+        processed += 1
@@ -0,0 +1,16 @@
+import pytest
+
+from job_search_agent.job_queue import SQLiteJobQueue, RedisJobQueue
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def queue(request, tmp_path, monkeypatch):
+    if request.param == "sqlite":
+        return SQLiteJobQueue(db_path=str(tmp_path / "jobs.db"))
+
+    # The Redis backend runs its Lua scripts against an in-memory server
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = pytest.importorskip("redis")
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis.Redis, "from_url", staticmethod(lambda url, **kwargs: fakeredis.FakeRedis(server=server)))
+    return RedisJobQueue(namespace="test")
@@ -0,0 +1,62 @@
+import json
+import os
+
+import pytest
+
+# The crew module builds the crewai tools at import time
+pytest.importorskip("crewai_tools")
+
+from crewai_tools import SerperDevTool
+
+from job_search_agent.crew import JobSearchAgent
+
+INPUT_FOLDER = os.path.join(os.path.dirname(__file__), "..", "input")
+
+
+@pytest.fixture(autouse=True)
+def model(monkeypatch, tmp_path):
+    monkeypatch.setenv("MODEL", "gemini/gemini-2.0-flash")
+    monkeypatch.chdir(tmp_path)
+
+
+def task_names(crew):
+    return [task.name for task in crew.tasks]
+
+
+def test_fast_path_leaves_cv_parser_out_of_every_crew_copy():
+    inputs = {"input_folder": INPUT_FOLDER}
+    job_search = JobSearchAgent.from_inputs(inputs)
+    crew = job_search.crew()
+
+    expected = ["search_jobs_task", "tailor_cv_task", "write_cover_letter_task"]
+    # kickoff_for_each, train and test run a copy of the crew
+    assert task_names(crew) == expected
+    assert task_names(crew.copy()) == expected
+    assert job_search.cv_parser().role not in [agent.role for agent in crew.agents]
+    assert all("{structured_resume}" in task.description for task in crew.tasks)
+
+    job_search.prepare_input(inputs)
+    assert json.loads(inputs["structured_resume"])["contact_info"]["name"] == "Nguyen Van A"
+    with open("output/structured_resume.json", encoding="utf-8") as file:
+        assert json.load(file)["contact_info"]["name"] == "Nguyen Van A"
+
+
+def test_cv_parser_runs_without_fast_path():
+    crew = JobSearchAgent.from_inputs({"input_folder": INPUT_FOLDER, "fast_path_parsing": False}).crew()
+
+    assert task_names(crew) == ["parse_cv_task", "search_jobs_task", "tailor_cv_task", "write_cover_letter_task"]
+    assert [task.name for task in crew.tasks[1].context] == ["parse_cv_task"]
+
+
+def test_search_config_is_applied_when_the_crew_is_built():
+    inputs = {"input_folder": INPUT_FOLDER, "location": "Da Nang, Vietnam", "n_results": 5}
+    job_search = JobSearchAgent.from_inputs(inputs)
+
+    search_tool = next(tool for tool in job_search.job_scout().tools if isinstance(tool, SerperDevTool))
+    assert (search_tool.location, search_tool.n_results, search_tool.country) == ("Da Nang, Vietnam", 5, "vn")
+
+    prepared = job_search.prepare_input(dict(inputs))
+    assert prepared["location"] == "Da Nang, Vietnam"
+
+    with pytest.raises(ValueError, match="location"):
+        job_search.prepare_input({"input_folder": INPUT_FOLDER, "location": "Hue, Vietnam"})
@@ -0,0 +1,44 @@
+import asyncio
+import json
+import os
+
+import docx
+import pytest
+
+from job_search_agent.tools.custom_tool import async_check_resume_and_extract_content, async_organize_output_files
+from job_search_agent.tools.resume_parser import extract_resume_content
+
+
+def test_async_extraction_matches_crew_extraction(tmp_path):
+    doc = docx.Document()
+    doc.add_paragraph("Jane Doe", style="Title")
+    doc.add_heading("Experience", level=1)
+    doc.add_paragraph("Built payment services in Go", style="List Bullet")
+    doc.save(str(tmp_path / "resume.docx"))
+
+    content = asyncio.run(async_check_resume_and_extract_content(str(tmp_path)))
+
+    assert content == extract_resume_content(str(tmp_path))
+    assert content.splitlines() == ["# Jane Doe", "## Experience", "- Built payment services in Go"]
+
+
+def test_async_extraction_without_resume_exits(tmp_path):
+    with pytest.raises(SystemExit):
+        asyncio.run(async_check_resume_and_extract_content(str(tmp_path)))
+
+
+def test_async_organize_output_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("output")
+    with open("output/tailored_cover_letter.json", "w", encoding="utf-8") as file:
+        json.dump({"tailored_cover_letters": [
+            {"company_name": "Acme Corp", "job_title": "Engineer", "cover_letter_content": "Dear Hiring Manager,\n\nHello."},
+        ]}, file)
+    with open("output/tailored_cv.json", "w", encoding="utf-8") as file:
+        json.dump({"tailored_cvs": [
+            {"company_name": "Acme Corp", "job_title": "Engineer", "tailored_cv_content": {"summary": "Engineer."}},
+        ]}, file)
+
+    asyncio.run(async_organize_output_files("output"))
+
+    assert sorted(os.listdir("output/Acme_Corp-Engineer")) == ["cover_letter.docx", "cv.docx"]
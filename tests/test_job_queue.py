@@ -0,0 +1,73 @@
+import time
+
+
+def test_claim_returns_oldest_job_once(queue):
+    first = queue.enqueue({"n": 1})
+    queue.enqueue({"n": 2})
+
+    job = queue.claim("w1")
+    assert job.id == first
+    assert job.payload == {"n": 1}
+    assert job.attempts == 1
+
+    assert queue.claim("w2").payload == {"n": 2}
+    assert queue.claim("w3") is None
+
+
+def test_heartbeat_only_extends_own_lease(queue):
+    job_id = queue.enqueue({})
+    queue.claim("w1", lease_seconds=60)
+
+    assert queue.heartbeat(job_id, "w1", lease_seconds=60)
+    assert not queue.heartbeat(job_id, "w2", lease_seconds=60)
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(queue):
+    job_id = queue.enqueue({})
+    queue.claim("w1", lease_seconds=0.1)
+    time.sleep(0.2)
+
+    job = queue.claim("w2")
+    assert job.id == job_id
+    assert job.attempts == 2
+    assert queue.status(job_id)["worker_id"] == "w2"
+
+    # The original worker lost its lease and can no longer publish
+    assert not queue.heartbeat(job_id, "w1")
+    assert not queue.complete(job_id, "w1", {"raw": "late"}, {"cv.json": b"late"})
+    assert queue.status(job_id)["artifacts"] == []
+
+
+def test_fail_requeues_until_attempts_exhausted(queue):
+    job_id = queue.enqueue({}, max_attempts=2)
+
+    queue.claim("w1")
+    assert queue.fail(job_id, "w1", "boom")
+    status = queue.status(job_id)
+    assert status["status"] == "queued"
+    assert status["error"] == "boom"
+
+    queue.claim("w1")
+    assert queue.fail(job_id, "w1", "boom again")
+    assert queue.status(job_id)["status"] == "failed"
+    assert queue.claim("w1") is None
+
+
+def test_expired_lease_without_attempts_left_fails_job(queue):
+    job_id = queue.enqueue({}, max_attempts=1)
+    queue.claim("w1", lease_seconds=0.1)
+    time.sleep(0.2)
+
+    assert queue.claim("w2") is None
+    assert queue.status(job_id)["status"] == "failed"
+
+
+def test_complete_publishes_result_and_artifacts(queue):
+    job_id = queue.enqueue({})
+    queue.claim("w1")
+
+    assert queue.complete(job_id, "w1", {"raw": "ok"}, {"output/cv.json": b"{}"})
+    status = queue.status(job_id)
+    assert status["status"] == "done"
+    assert status["result"] == {"raw": "ok"}
+    assert status["artifacts"] == ["output/cv.json"]
@@ -0,0 +1,145 @@
+import json
+import time
+
+import litellm
+import pytest
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.exceptions.context_window_exceeding_exception import LLMContextLengthExceededException
+
+from job_search_agent.llm_router import LatencyTracker, RoutedLLM
+
+
+class StubLLM(BaseLLM):
+    """
+    Returns (or raises) the queued responses in order, optionally after a delay.
+    """
+
+    def __init__(self, model, responses=(), delay=0.0, context_window=8192):
+        super().__init__(model=model, temperature=0.5)
+        self.responses = list(responses)
+        self.delay = delay
+        self.context_window = context_window
+        self.calls = 0
+        self.stop_seen = None
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        self.calls += 1
+        self.stop_seen = self.stop
+        time.sleep(self.delay)
+        response = self.responses.pop(0)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    def supports_function_calling(self):
+        return True
+
+    def get_context_window_size(self):
+        return self.context_window
+
+
+def rate_limit_error():
+    return litellm.RateLimitError("slow down", llm_provider="gemini", model="primary")
+
+
+def timeout_error():
+    return litellm.Timeout("timed out", model="primary", llm_provider="gemini")
+
+
+def test_uses_primary_and_records_latency():
+    tracker = LatencyTracker()
+    primary, fallback = StubLLM("primary", ["ok"]), StubLLM("fallback")
+    router = RoutedLLM(primary, fallback=fallback, tracker=tracker)
+    router.stop = ["\nObservation:"]
+
+    assert router.call("hi") == "ok"
+    assert primary.stop_seen == ["\nObservation:"]
+    assert fallback.calls == 0
+    assert tracker.snapshot()["primary"]["calls"] == 1
+
+
+def test_falls_back_on_error_without_cooldown():
+    tracker = LatencyTracker()
+    primary = StubLLM("primary", [ValueError("bad response"), "primary again"])
+    fallback = StubLLM("fallback", ["from fallback"])
+    router = RoutedLLM(primary, fallback=fallback, tracker=tracker)
+
+    assert router.call("hi") == "from fallback"
+    assert tracker.snapshot()["primary"]["failures"] == 1
+
+    # Other errors do not put the primary into cooldown
+    assert router.call("hi") == "primary again"
+
+
+@pytest.mark.parametrize("error", [rate_limit_error, timeout_error])
+def test_throttled_primary_cools_down(error):
+    primary = StubLLM("primary", [error(), "primary again"])
+    fallback = StubLLM("fallback", ["fallback 1", "fallback 2"])
+    router = RoutedLLM(primary, fallback=fallback, cooldown=0.2)
+
+    assert router.call("hi") == "fallback 1"
+    assert router.call("hi") == "fallback 2"
+    assert primary.calls == 1
+
+    time.sleep(0.25)
+    assert router.call("hi") == "primary again"
+
+
+def test_slow_primary_cools_down():
+    primary = StubLLM("primary", ["slow"], delay=0.05)
+    fallback = StubLLM("fallback", ["fast"])
+    router = RoutedLLM(primary, fallback=fallback, slow_threshold=0.01, cooldown=60)
+
+    assert router.call("hi") == "slow"
+    assert router.call("hi") == "fast"
+    assert primary.calls == 1
+
+
+def test_context_length_error_is_not_retried():
+    primary = StubLLM("primary", [LLMContextLengthExceededException("maximum context length")])
+    fallback = StubLLM("fallback", ["unused"])
+    router = RoutedLLM(primary, fallback=fallback)
+
+    with pytest.raises(LLMContextLengthExceededException):
+        router.call("hi")
+    assert fallback.calls == 0
+
+
+def test_raises_when_last_candidate_fails():
+    tracker = LatencyTracker()
+    primary = StubLLM("primary", [ValueError("primary down")])
+    fallback = StubLLM("fallback", [RuntimeError("fallback down")])
+    router = RoutedLLM(primary, fallback=fallback, tracker=tracker)
+
+    with pytest.raises(RuntimeError, match="fallback down"):
+        router.call("hi")
+    assert tracker.snapshot()["fallback"]["failures"] == 1
+
+
+def test_without_fallback_errors_propagate():
+    router = RoutedLLM(StubLLM("primary", [ValueError("down")]))
+
+    with pytest.raises(ValueError):
+        router.call("hi")
+
+
+def test_context_window_fits_both_models():
+    router = RoutedLLM(StubLLM("primary", context_window=1000000), fallback=StubLLM("fallback", context_window=32000))
+    assert router.get_context_window_size() == 32000
+
+
+def test_latency_tracker_moving_average_and_failures(tmp_path):
+    tracker = LatencyTracker(smoothing=0.5)
+    tracker.record("model", 1.0)
+    tracker.record("model", 3.0)
+    tracker.record("model", 10.0, ok=False)
+
+    stats = tracker.snapshot()["model"]
+    assert stats == {"calls": 3, "failures": 1, "avg_latency": 2.0, "max_latency": 3.0}
+
+    path = tmp_path / "output" / "model_latency.json"
+    tracker.save(str(path))
+    assert json.loads(path.read_text()) == {"model": stats}
+
+    tracker.reset()
+    assert tracker.snapshot() == {}
@@ -0,0 +1,159 @@
+import os
+
+import docx
+
+from job_search_agent.tools.resume_parser import parse_resume, docx_to_markdown
+
+EXAMPLE_CV = os.path.join(os.path.dirname(__file__), "..", "input", "example_cv.md")
+
+PLAIN_TEXT_RESUME = """Jane Doe
+Hanoi, Vietnam
+jane.doe@example.com
+
+SUMMARY
+Backend engineer with eight years of experience building APIs.
+
+EXPERIENCE
+Senior Engineer - Acme Corp
+2021 - Present
+- Designed the public REST API
+- Led the migration to PostgreSQL
+Engineer - Beta Ltd
+2018 - 2021
+- Built payment services in Go
+
+EDUCATION
+BSc Computer Science
+Hanoi University
+2014 - 2018
+
+PROJECTS
+Job Board
+- Side project matching engineers to startups
+
+SKILLS
+Languages: Python, Go
+"""
+
+
+def test_parses_example_cv():
+    with open(EXAMPLE_CV, encoding="utf-8") as file:
+        resume, confidence, missing = parse_resume(file.read())
+
+    assert resume is not None
+    assert confidence == 1.0
+    assert missing == []
+    assert resume.contact_info.name == "Nguyen Van A"
+    assert resume.contact_info.email == "nguyenvana@email.com"
+    assert [(exp.job_title, exp.company_name, exp.dates) for exp in resume.work_experience] == [
+        ("Software Engineering Intern", "FPT Software", "Jun 2023 – Aug 2023"),
+    ]
+    assert resume.education[0].degree == "Bachelor of Science in Computer Science"
+    assert [project.project_name for project in resume.projects] == [
+        "Resume Rewriter – Python, Flask",
+        "Personal Finance Tracker – React, Firebase",
+    ]
+
+
+def test_splits_plain_text_jobs_on_title_and_dates():
+    resume, confidence, missing = parse_resume(PLAIN_TEXT_RESUME)
+
+    assert resume is not None
+    assert confidence == 1.0
+    assert [(exp.job_title, exp.company_name, exp.dates) for exp in resume.work_experience] == [
+        ("Senior Engineer", "Acme Corp", "2021 - Present"),
+        ("Engineer", "Beta Ltd", "2018 - 2021"),
+    ]
+    assert resume.work_experience[0].responsibilities == [
+        "Designed the public REST API",
+        "Led the migration to PostgreSQL",
+    ]
+    assert resume.work_experience[1].responsibilities == ["Built payment services in Go"]
+
+
+def test_ambiguous_entry_falls_back_to_llm():
+    # Two date ranges under one title usually means two roles were merged into one entry
+    text = PLAIN_TEXT_RESUME.replace("2021 - Present\n", "2021 - Present\n2019 - 2021\n")
+    resume, confidence, missing = parse_resume(text)
+
+    assert resume is None
+    assert confidence < 0.8
+    assert "entries_unambiguous" in missing
+    assert "work_experience" in missing
+
+
+def test_parses_docx_via_markdown():
+    doc = docx.Document()
+    doc.add_paragraph("Jane Doe", style="Title")
+    doc.add_paragraph("Location: Hanoi, Vietnam")
+    doc.add_paragraph("jane.doe@example.com")
+    doc.add_heading("Summary", level=1)
+    doc.add_paragraph("Backend engineer with eight years of experience building APIs.")
+    doc.add_heading("Experience", level=1)
+    doc.add_heading("Senior Engineer - Acme Corp", level=2)
+    doc.add_paragraph("2021 - Present")
+    doc.add_paragraph("Designed the public REST API", style="List Bullet")
+    doc.add_heading("Engineer - Beta Ltd", level=2)
+    doc.add_paragraph("2018 - 2021")
+    doc.add_paragraph("Built payment services in Go", style="List Bullet")
+    doc.add_heading("Education", level=1)
+    doc.add_heading("BSc Computer Science", level=2)
+    doc.add_paragraph("Hanoi University")
+    doc.add_paragraph("2014 - 2018")
+    doc.add_heading("Projects", level=1)
+    doc.add_heading("Job Board", level=2)
+    doc.add_paragraph("Side project matching engineers to startups", style="List Bullet")
+    doc.add_heading("Skills", level=1)
+    doc.add_paragraph("Languages: Python, Go", style="List Bullet")
+
+    resume, confidence, missing = parse_resume(docx_to_markdown(doc))
+
+    assert resume is not None
+    assert confidence == 1.0
+    assert resume.contact_info.name == "Jane Doe"
+    assert resume.contact_info.location == "Hanoi, Vietnam"
+    assert [(exp.job_title, exp.company_name, exp.dates) for exp in resume.work_experience] == [
+        ("Senior Engineer", "Acme Corp", "2021 - Present"),
+        ("Engineer", "Beta Ltd", "2018 - 2021"),
+    ]
+    assert resume.skills.languages == ["Python", "Go"]
+
+
+def test_numeric_month_dates_are_kept():
+    text = PLAIN_TEXT_RESUME.replace("2021 - Present", "03/2021 - 05/2023").replace("2018 - 2021", "01-2018 - 02-2021")
+    resume, confidence, missing = parse_resume(text)
+
+    assert confidence == 1.0
+    assert [exp.dates for exp in resume.work_experience] == ["03/2021 - 05/2023", "01-2018 - 02-2021"]
+
+
+def test_unrecognized_date_format_falls_back_to_llm():
+    text = PLAIN_TEXT_RESUME.replace("2021 - Present", "2021.03 - 2023.05")
+    resume, confidence, missing = parse_resume(text)
+
+    assert resume is None
+    assert "entries_unambiguous" in missing
+
+
+def test_document_title_is_not_taken_as_name():
+    resume, confidence, missing = parse_resume("CURRICULUM VITAE\n\n" + PLAIN_TEXT_RESUME)
+
+    assert resume.contact_info.name == "Jane Doe"
+    assert confidence == 1.0
+
+
+def test_name_that_does_not_look_like_a_name_lowers_confidence():
+    resume, confidence, missing = parse_resume(PLAIN_TEXT_RESUME.replace("Jane Doe", "Profile 2024"))
+
+    assert resume is None
+    assert confidence < 1.0
+    assert "contact_info.name" in missing
+
+
+def test_missing_summary_falls_back_to_llm():
+    text = PLAIN_TEXT_RESUME.replace("SUMMARY\nBackend engineer with eight years of experience building APIs.\n", "")
+    resume, confidence, missing = parse_resume(text)
+
+    assert resume is None
+    assert confidence >= 0.8
+    assert "summary" in missing
@@ -0,0 +1,132 @@
+import time
+
+import pytest
+
+# The worker imports the crew, which needs the crewai tools
+pytest.importorskip("crewai_tools")
+
+from job_search_agent import worker
+from job_search_agent.worker import LeaseKeeper, run_worker
+
+
+class FlakyQueue:
+    """
+    Wraps a queue and raises ConnectionError on the first `failures[name]` calls of each method.
+    """
+
+    def __init__(self, queue, **failures):
+        self.queue = queue
+        self.failures = failures
+
+    def __getattr__(self, name):
+        method = getattr(self.queue, name)
+        if self.failures.get(name, 0) <= 0:
+            return method
+
+        def broken(*args, **kwargs):
+            self.failures[name] -= 1
+            raise ConnectionError(f"{name} unavailable")
+        return broken
+
+
+def succeed(job):
+    return {"raw": "ok"}, {"cv.json": b"{}"}
+
+
+def test_run_worker_publishes_result(queue, monkeypatch):
+    monkeypatch.setattr(worker, "process_job", succeed)
+    job_id = queue.enqueue({})
+
+    run_worker(queue, worker_id="w1", poll_interval=0, max_jobs=1)
+
+    status = queue.status(job_id)
+    assert status["status"] == "done"
+    assert status["result"] == {"raw": "ok"}
+    assert status["artifacts"] == ["cv.json"]
+
+
+def test_system_exit_from_crew_fails_job(queue, monkeypatch):
+    def exit_crew(job):
+        raise SystemExit("No tailored CVs found in the output file.")
+
+    monkeypatch.setattr(worker, "process_job", exit_crew)
+    job_id = queue.enqueue({})
+
+    run_worker(queue, worker_id="w1", poll_interval=0, max_jobs=1)
+
+    status = queue.status(job_id)
+    assert status["status"] == "queued"
+    assert status["error"].startswith("No tailored CVs found in the output file.")
+
+
+def test_result_is_discarded_after_lease_is_lost(queue, monkeypatch):
+    # Heartbeats fail, so the lease expires while the crew runs and another worker takes the job
+    def slow_job(job):
+        time.sleep(0.3)
+        assert queue.claim("w2").id == job.id
+        return succeed(job)
+
+    monkeypatch.setattr(worker, "process_job", slow_job)
+    job_id = queue.enqueue({})
+
+    run_worker(FlakyQueue(queue, heartbeat=100), worker_id="w1", lease_seconds=0.2, poll_interval=0, max_jobs=1)
+
+    status = queue.status(job_id)
+    assert status["status"] == "running"
+    assert status["worker_id"] == "w2"
+    assert status["result"] is None
+    assert status["artifacts"] == []
+
+
+def test_lease_keeper_keeps_long_job_leased(queue, monkeypatch):
+    def long_job(job):
+        time.sleep(0.8)
+        assert queue.claim("w2") is None
+        return succeed(job)
+
+    monkeypatch.setattr(worker, "process_job", long_job)
+    job_id = queue.enqueue({})
+
+    run_worker(queue, worker_id="w1", lease_seconds=0.3, poll_interval=0, max_jobs=1)
+
+    assert queue.status(job_id)["status"] == "done"
+
+
+def test_lease_keeper_reports_lost_lease(queue):
+    job_id = queue.enqueue({})
+    queue.claim("w1", lease_seconds=0.1)
+    time.sleep(0.2)
+    queue.claim("w2")
+
+    keeper = LeaseKeeper(queue, job_id, "w1", lease_seconds=0.3)
+    keeper.start()
+    keeper.join(timeout=1)
+
+    assert not keeper.is_alive()
+    assert keeper.lease_lost
+
+
+def test_worker_survives_queue_errors(queue, monkeypatch):
+    def crash(job):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(worker, "process_job", crash)
+    job_id = queue.enqueue({})
+    flaky = FlakyQueue(queue, claim=2, fail=1)
+
+    run_worker(flaky, worker_id="w1", poll_interval=0, max_jobs=1)
+
+    # The failure could not be reported, so the job stays leased until it expires
+    assert flaky.failures == {"claim": 0, "fail": 0}
+    assert queue.status(job_id)["worker_id"] == "w1"
+
+
+def test_worker_survives_publish_error(queue, monkeypatch):
+    monkeypatch.setattr(worker, "process_job", succeed)
+    first = queue.enqueue({})
+    second = queue.enqueue({})
+
+    run_worker(FlakyQueue(queue, complete=1), worker_id="w1", poll_interval=0, max_jobs=2)
+
+    assert queue.status(first)["status"] == "running"
+    assert queue.status(second)["status"] == "done"